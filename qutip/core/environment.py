@@ -18,17 +18,19 @@ __all__ = ['BosonicEnvironment',
 
 import abc
 import enum
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 from typing import Any, Callable, Literal, Sequence, overload
 import warnings
 
 import numpy as np
 from numpy.typing import ArrayLike
+import scipy.fft
 from scipy.linalg import eigvalsh
 from scipy.interpolate import CubicSpline
 
 try:
-    from mpmath import mp
+    from mpmath import fp
     _mpmath_available = True
 except ModuleNotFoundError:
     _mpmath_available = False
@@ -77,6 +79,10 @@ class BosonicEnvironment(abc.ABC):
     def __init__(self, T: float = None, tag: Any = None):
         self.T = T
         self.tag = tag
+        # Cached _fft interpolators, see _ps_from_cf / _cf_from_ps
+        self._fft_cache = {}
+        # Cached thermal occupations, see _n_thermal
+        self._nth_cache = None
 
     @abc.abstractmethod
     def spectral_density(self, w: float | ArrayLike) -> (float | ArrayLike):
@@ -313,6 +319,20 @@ class BosonicEnvironment(abc.ABC):
 
     # --- spectral density, power spectrum, correlation function conversions
 
+    def _n_thermal(self, w):
+        # n_thermal evaluated on the given frequencies, memoizing the last
+        # result. The temperature is fixed per environment and conversions are
+        # often evaluated repeatedly on the same frequency grid; comparing the
+        # grids is much cheaper than recomputing the exponentials.
+        cache = self._nth_cache
+        if (cache is not None and cache[0] == self.T
+                and np.array_equal(cache[1], w)):
+            return cache[2]
+
+        result = n_thermal(w, self.T)
+        self._nth_cache = (self.T, np.copy(w), result)
+        return result
+
     def _ps_from_sd(self, w, eps, derivative=None):
         # derivative: value of J'(0)
         if self.T is None:
@@ -325,33 +345,36 @@ class BosonicEnvironment(abc.ABC):
 
         # at zero frequency, we do numerical differentiation
         # S(0) = 2 J'(0) / beta
-        zero_mask = (w == 0)
-        nonzero_mask = np.invert(zero_mask)
-
-        S = np.zeros_like(w)
         if derivative is None:
-            S[zero_mask] = 2 * self.T * self.spectral_density(eps) / eps
+            S0 = 2 * self.T * self.spectral_density(eps) / eps
         else:
-            S[zero_mask] = 2 * self.T * derivative
-        S[nonzero_mask] = (
-            2 * np.sign(w[nonzero_mask])
-            * self.spectral_density(np.abs(w[nonzero_mask]))
-            * (n_thermal(w[nonzero_mask], self.T) + 1)
+            S0 = 2 * self.T * derivative
+
+        # branchless evaluation: replace zeros by a harmless dummy frequency
+        # and substitute S0 afterwards, avoiding masked gathers and scatters
+        w_safe = np.where(w == 0, 1.0, w)
+        S = (
+            2 * np.sign(w_safe)
+            * self.spectral_density(np.abs(w_safe))
+            * (self._n_thermal(w_safe) + 1)
         )
+        S = np.where(w == 0, S0, S)
         return S.item() if w.ndim == 0 else S
 
     def _sd_from_ps(self, w):
         w = np.asarray(w, dtype=float)
         J = np.zeros_like(w)
         positive_mask = (w > 0)
-        power_spectrum = self.power_spectrum(w[positive_mask])
+        w_pos = w[positive_mask]
+        power_spectrum = self.power_spectrum(w_pos)
 
         if self.T is None:
             raise ValueError(
                 "The temperature must be specified for this operation.")
 
+        # single pass over the positive frequencies: J = S / (2 (n + 1))
         J[positive_mask] = (
-            power_spectrum / 2 / (n_thermal(w[positive_mask], self.T) + 1)
+            power_spectrum / (2 * (self._n_thermal(w_pos) + 1))
         )
         return J.item() if w.ndim == 0 else J
 
@@ -364,7 +387,8 @@ class BosonicEnvironment(abc.ABC):
         else:
             wMax = max(np.abs(w[0]), np.abs(w[-1]))
 
-        mirrored_result = _fft(self.correlation_function, wMax, tMax=tMax)
+        mirrored_result = self._cached_fft(
+            'cf', self.correlation_function, wMax, tMax)
         result = np.real(mirrored_result(-w))
         return result.item() if w.ndim == 0 else result
 
@@ -377,11 +401,33 @@ class BosonicEnvironment(abc.ABC):
         else:
             tMax = max(np.abs(t[0]), np.abs(t[-1]))
 
-        result_fct = _fft(lambda w: self.power_spectrum(w, **ps_kwargs),
-                          tMax, tMax=wMax)
+        result_fct = self._cached_fft(
+            ('ps', *sorted(ps_kwargs.items())),
+            lambda w: self.power_spectrum(w, **ps_kwargs), tMax, wMax)
         result = result_fct(t) / (2 * np.pi)
         return result.item() if t.ndim == 0 else result
 
+    def _fft_cache_key(self):
+        # The physical parameters that the transformed functions depend on.
+        # Subclasses with mutable parameters override this so that mutating a
+        # parameter invalidates the cached transforms.
+        return (self.T,)
+
+    def _cached_fft(self, key, fun, wMax, tMax):
+        # The interpolator returned by _fft covers frequencies up to wMax (its
+        # sampling rate is chosen based on wMax) and is therefore also valid
+        # for any smaller frequency range, so we can reuse it across calls.
+        # This avoids recomputing large FFTs when the correlation function /
+        # power spectrum is evaluated repeatedly, e.g. during fitting.
+        key = (key, self._fft_cache_key())
+        cached = self._fft_cache.get(key)
+        if cached is not None and cached[0] >= wMax and cached[1] == tMax:
+            return cached[2]
+
+        result = _fft(fun, wMax, tMax=tMax)
+        self._fft_cache[key] = (wMax, tMax, result)
+        return result
+
     # --- fitting
 
     def approx_by_cf_fit(
@@ -557,25 +603,37 @@ class BosonicEnvironment(abc.ABC):
             guess_re, lower_re, upper_re = guess, lower, upper
             guess_im, lower_im, upper_im = guess, lower, upper
 
-        # Fit real part
-        start_real = time()
-        rmse_real, params_real = iterated_fit(
-            _cf_real_fit_model, num_params, tlist, np.real(clist), target_rsme,
-            Nr_min, Nr_max, guess=guess_re, lower=lower_re, upper=upper_re,
-            sigma=sigma, maxfev=maxfev
-        )
-        end_real = time()
-        fit_time_real = end_real - start_real
-
-        # Fit imaginary part
-        start_imag = time()
-        rmse_imag, params_imag = iterated_fit(
-            _cf_imag_fit_model, num_params, tlist, np.imag(clist), target_rsme,
-            Ni_min, Ni_max, guess=guess_im, lower=lower_im, upper=upper_im,
-            sigma=sigma, maxfev=maxfev
-        )
-        end_imag = time()
-        fit_time_imag = end_imag - start_imag
+        # The fits of the real and imaginary parts are independent; run them
+        # concurrently. The optimizer spends most of its time in scipy and
+        # numpy routines that release the GIL, so threads suffice here.
+        # No analytic Jacobian for the real-part fit: at the default guess
+        # (c = d = 0), its c and d columns vanish exactly, leaving the
+        # optimizer stuck at that saddle point. The finite-difference
+        # estimate escapes it through its truncation error.
+        def fit_real():
+            start = time()
+            rmse, params = iterated_fit(
+                _cf_real_fit_model, num_params, tlist, np.real(clist),
+                target_rsme, Nr_min, Nr_max, guess=guess_re, lower=lower_re,
+                upper=upper_re, sigma=sigma, maxfev=maxfev
+            )
+            return rmse, params, time() - start
+
+        def fit_imag():
+            start = time()
+            rmse, params = iterated_fit(
+                _cf_imag_fit_model, num_params, tlist, np.imag(clist),
+                target_rsme, Ni_min, Ni_max, guess=guess_im, lower=lower_im,
+                upper=upper_im, sigma=sigma, maxfev=maxfev,
+                jac=_cf_imag_fit_model_jac
+            )
+            return rmse, params, time() - start
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_real = executor.submit(fit_real)
+            future_imag = executor.submit(fit_imag)
+            rmse_real, params_real, fit_time_real = future_real.result()
+            rmse_imag, params_imag, fit_time_imag = future_imag.result()
 
         # Generate summary
         Nr = len(params_real)
@@ -591,27 +649,8 @@ class BosonicEnvironment(abc.ABC):
                     "params_imag": params_imag, "summary": full_summary}
 
         # Finally, generate environment and return
-        ckAR = []
-        vkAR = []
-        for term in params_real:
-            if full_ansatz:
-                a, b, c, d = term
-            else:
-                a, b, c = term
-                d = 0
-            ckAR.extend([(a + 1j * d) / 2, (a - 1j * d) / 2])
-            vkAR.extend([-b - 1j * c, -b + 1j * c])
-
-        ckAI = []
-        vkAI = []
-        for term in params_imag:
-            if full_ansatz:
-                a, b, c, d = term
-            else:
-                a, b, c = term
-                d = 0
-            ckAI.extend([-1j * (a + 1j * d) / 2, 1j * (a - 1j * d) / 2])
-            vkAI.extend([-b - 1j * c, -b + 1j * c])
+        ckAR, vkAR = _cf_fit_coefficients(params_real)
+        ckAI, vkAI = _cf_fit_coefficients(params_imag, imag=True)
 
         approx_env = ExponentialBosonicEnvironment(
             ckAR, vkAR, ckAI, vkAI, combine=combine, T=self.T, tag=tag)
@@ -735,7 +774,8 @@ class BosonicEnvironment(abc.ABC):
         start = time()
         rmse, params = iterated_fit(
             _sd_fit_model, 3, wlist, jlist, target_rmse, Nmin, Nmax,
-            guess=guess, lower=lower, upper=upper, sigma=sigma, maxfev=maxfev
+            guess=guess, lower=lower, upper=upper, sigma=sigma, maxfev=maxfev,
+            jac=_sd_fit_model_jac
         )
         end = time()
         fit_time = end - start
@@ -749,19 +789,18 @@ class BosonicEnvironment(abc.ABC):
             "N": N, "Nk": Nk, "fit_time": fit_time, "rmse": rmse,
             "params": params, "summary": summary}
 
-        ckAR, vkAR, ckAI, vkAI = [], [], [], []
         # Finally, generate environment and return
-        for a, b, c in params:
-            lam = np.sqrt(a + 0j)
-            gamma = 2 * b
-            w0 = np.sqrt(c**2 + b**2)
-
-            env = UnderDampedEnvironment(self.T, lam, gamma, w0)
-            coeffs = env._matsubara_params(Nk)
-            ckAR.extend(coeffs[0])
-            vkAR.extend(coeffs[1])
-            ckAI.extend(coeffs[2])
-            vkAI.extend(coeffs[3])
+        # Each Lorentzian term acts like an underdamped environment with the
+        # parameters computed here (in one broadcast over the fitted terms)
+        a, b, c = np.asarray(params).T
+        lams = np.sqrt(a + 0j)
+        gammas = 2 * b
+        w0s = np.sqrt(b**2 + c**2)
+
+        ckAR, vkAR, ckAI, vkAI = (
+            UnderDampedEnvironment._matsubara_coefficients(
+                self.T, lams, gammas, w0s, Nk)
+        )
 
         approx_env = ExponentialBosonicEnvironment(
             ckAR, vkAR, ckAI, vkAI, combine=combine, T=self.T, tag=tag)
@@ -779,15 +818,10 @@ class _BosonicEnvironment_fromCF(BosonicEnvironment):
             self.tMax = tMax
 
     def correlation_function(self, t, **kwargs):
+        # C(-t) = C(t)^*, so a single evaluation at |t| is sufficient
         t = np.asarray(t, dtype=float)
-        result = np.zeros_like(t, dtype=complex)
-        positive_mask = (t >= 0)
-        non_positive_mask = np.invert(positive_mask)
-
-        result[positive_mask] = self._cf(t[positive_mask])
-        result[non_positive_mask] = np.conj(
-            self._cf(-t[non_positive_mask])
-        )
+        values = np.asarray(self._cf(np.abs(t)), dtype=complex)
+        result = np.where(t >= 0, values, np.conj(values))
         return result.item() if t.ndim == 0 else result
 
     def spectral_density(self, w):
@@ -893,6 +927,7 @@ class DrudeLorentzEnvironment(BosonicEnvironment):
         self.lam = lam
         self.gamma = gamma
         self.Nk = Nk
+        self._mats_cache = None
 
     def spectral_density(self, w: float | ArrayLike) -> (float | ArrayLike):
         """
@@ -937,17 +972,16 @@ class DrudeLorentzEnvironment(BosonicEnvironment):
                              "at zero temperature.")
 
         t = np.asarray(t, dtype=float)
-        abs_t = np.abs(t)
+        abs_t = np.abs(np.atleast_1d(t))
         Nk = Nk or self.Nk
         ck_real, vk_real, ck_imag, vk_imag = self._pade_params(Nk)
 
-        def C(c, v):
-            return np.sum([ck * np.exp(-np.asarray(vk * abs_t))
-                           for ck, vk in zip(c, v)], axis=0)
-        result = C(ck_real, vk_real) + 1j * C(ck_imag, vk_imag)
+        result = (_exp_sum(ck_real, vk_real, abs_t)
+                  + 1j * _exp_sum(ck_imag, vk_imag, abs_t))
 
         result = np.asarray(result, dtype=complex)
-        result[t < 0] = np.conj(result[t < 0])
+        negative = (np.atleast_1d(t) < 0)
+        result[negative] = np.conj(result[negative])
         return result.item() if t.ndim == 0 else result
 
     def power_spectrum(
@@ -1123,19 +1157,23 @@ class DrudeLorentzEnvironment(BosonicEnvironment):
 
     def _matsubara_params(self, Nk):
         """ Calculate the Matsubara coefficients and frequencies. """
-        ck_real = [self.lam * self.gamma / np.tan(self.gamma / (2 * self.T))]
-        ck_real.extend([
-            (8 * self.lam * self.gamma * self.T * np.pi * k * self.T /
-                ((2 * np.pi * k * self.T)**2 - self.gamma**2))
-            for k in range(1, Nk + 1)
+        key = (self.lam, self.gamma, self.T, Nk)
+        if self._mats_cache is not None and self._mats_cache[0] == key:
+            return self._mats_cache[1]
+
+        wk = 2 * np.pi * np.arange(1, Nk + 1) * self.T
+        ck_real = np.concatenate([
+            [self.lam * self.gamma / np.tan(self.gamma / (2 * self.T))],
+            4 * self.lam * self.gamma * self.T * wk / (wk**2 - self.gamma**2),
         ])
-        vk_real = [self.gamma]
-        vk_real.extend([2 * np.pi * k * self.T for k in range(1, Nk + 1)])
+        vk_real = np.concatenate([[self.gamma], wk])
 
-        ck_imag = [-self.lam * self.gamma]
-        vk_imag = [self.gamma]
+        ck_imag = np.array([-self.lam * self.gamma])
+        vk_imag = np.array([self.gamma])
 
-        return ck_real, vk_real, ck_imag, vk_imag
+        result = (ck_real, vk_real, ck_imag, vk_imag)
+        self._mats_cache = (key, result)
+        return result
 
     # --- Pade approx calculation ---
 
@@ -1240,6 +1278,7 @@ class UnderDampedEnvironment(BosonicEnvironment):
         self.lam = lam
         self.gamma = gamma
         self.w0 = w0
+        self._mats_cache = None
 
     def spectral_density(self, w: float | ArrayLike) -> (float | ArrayLike):
         """
@@ -1295,6 +1334,9 @@ class UnderDampedEnvironment(BosonicEnvironment):
         wMax = self.w0 + 25 * self.gamma
         return self._cf_from_ps(t, wMax)
 
+    def _fft_cache_key(self):
+        return (self.T, self.lam, self.gamma, self.w0)
+
     def approx_by_matsubara(
         self, Nk: int, combine: bool = True, tag: Any = None
     ) -> ExponentialBosonicEnvironment:
@@ -1340,37 +1382,63 @@ class UnderDampedEnvironment(BosonicEnvironment):
                           "fitting the correlation function.")
             Nk = 0
 
-        Om = np.sqrt(self.w0**2 - (self.gamma / 2)**2)
-        Gamma = self.gamma / 2
+        key = (self.lam, self.gamma, self.w0, self.T, Nk)
+        if self._mats_cache is not None and self._mats_cache[0] == key:
+            return self._mats_cache[1]
 
-        z = np.inf if self.T == 0 else (Om + 1j * Gamma) / (2*self.T)
-        # we set the argument of the hyperbolic tangent to infinity if T=0
-        ck_real = ([
-            (self.lam**2 / (4 * Om)) * (1 / np.tanh(z)),
-            (self.lam**2 / (4 * Om)) * (1 / np.tanh(np.conjugate(z))),
-        ])
+        result = self._matsubara_coefficients(
+            self.T, self.lam, self.gamma, self.w0, Nk)
+        self._mats_cache = (key, result)
+        return result
 
-        ck_real.extend([
-            (-2 * self.lam**2 * self.gamma * self.T) * (2 * np.pi * k * self.T)
-            / (
-                ((Om + 1j * Gamma)**2 + (2 * np.pi * k * self.T)**2)
-                * ((Om - 1j * Gamma)**2 + (2 * np.pi * k * self.T)**2)
-            )
-            for k in range(1, Nk + 1)
-        ])
+    @staticmethod
+    def _matsubara_coefficients(T, lam, gamma, w0, Nk):
+        """
+        Matsubara coefficients and frequencies, broadcast over arrays of
+        underdamped parameters. The returned arrays list the coefficients of
+        all provided environments in order, i.e., the two resonant modes of
+        the first environment followed by its `Nk` Matsubara terms, then the
+        modes of the second environment, and so on.
+        """
 
-        vk_real = [-1j * Om + Gamma, 1j * Om + Gamma]
-        vk_real.extend([
-            2 * np.pi * k * self.T
-            for k in range(1, Nk + 1)
-        ])
+        if Nk > 0 and T == 0:
+            warnings.warn("The Matsubara expansion cannot be performed at "
+                          "zero temperature. Use other approaches such as "
+                          "fitting the correlation function.")
+            Nk = 0
 
-        ck_imag = [
-            1j * self.lam**2 / (4 * Om),
-            -1j * self.lam**2 / (4 * Om),
-        ]
+        lam = np.atleast_1d(lam)
+        gamma = np.atleast_1d(gamma)
+        w0 = np.atleast_1d(w0)
 
-        vk_imag = [-1j * Om + Gamma, 1j * Om + Gamma]
+        Gamma = gamma / 2
+        Om = np.sqrt(w0**2 - Gamma**2)
+        prefactor = lam**2 / (4 * Om)
+
+        if T == 0:
+            # corresponds to an infinite argument of the hyperbolic cotangent
+            coth_z = np.ones_like(Om, dtype=complex)
+        else:
+            coth_z = _coth((Om + 1j * Gamma) / (2 * T))
+        wk = 2 * np.pi * np.arange(1, Nk + 1) * T
+
+        vk_osc = np.stack([-1j * Om + Gamma, 1j * Om + Gamma], axis=1)
+        ck_real = np.concatenate([
+            np.stack(
+                [prefactor * coth_z, prefactor * np.conjugate(coth_z)],
+                axis=1,
+            ),
+            (-2 * lam[:, None]**2 * gamma[:, None] * T) * wk[None, :] / (
+                ((Om[:, None] + 1j * Gamma[:, None])**2 + wk[None, :]**2)
+                * ((Om[:, None] - 1j * Gamma[:, None])**2 + wk[None, :]**2)
+            ),
+        ], axis=1).ravel()
+        vk_real = np.concatenate([
+            vk_osc, np.broadcast_to(wk + 0j, (len(Om), Nk)),
+        ], axis=1).ravel()
+
+        ck_imag = np.stack([1j * prefactor, -1j * prefactor], axis=1).ravel()
+        vk_imag = vk_osc.ravel()
 
         return ck_real, vk_real, ck_imag, vk_imag
 
@@ -1488,20 +1556,21 @@ class OhmicEnvironment(BosonicEnvironment):
 
         if self.T != 0:
             corr = (self.alpha * self.wc ** (1 - self.s) / np.pi
-                    * mp.gamma(self.s + 1) * self.T ** (self.s + 1))
+                    * fp.gamma(self.s + 1) * self.T ** (self.s + 1))
             z1_u = ((1 + self.wc / self.T - 1j * self.wc * t)
                     / (self.wc / self.T))
             z2_u = (1 + 1j * self.wc * t) / (self.wc / self.T)
+            # fp.zeta works with hardware floats, which is much faster than
+            # the arbitrary-precision mp context and sufficient here
+            zeta = np.frompyfunc(fp.zeta, 2, 1)
             result = np.asarray(
-                [corr * (mp.zeta(self.s + 1, u1) + mp.zeta(self.s + 1, u2))
-                 for u1, u2 in zip(z1_u, z2_u)],
+                corr * (zeta(self.s + 1, z1_u) + zeta(self.s + 1, z2_u)),
                 dtype=np.cdouble
             )
         else:
-            corr = (self.alpha * self.wc**(self.s + 1) / np.pi
-                    * mp.gamma(self.s + 1)
-                    * (1 + 1j * self.wc * t) ** (-self.s - 1))
-            result = np.asarray(corr, dtype=np.cdouble)
+            result = (self.alpha * self.wc**(self.s + 1) / np.pi
+                      * fp.gamma(self.s + 1)
+                      * (1 + 1j * self.wc * t) ** (-self.s - 1))
 
         if t_was_array:
             return result
@@ -1745,6 +1814,21 @@ class ExponentialBosonicEnvironment(BosonicEnvironment):
         if combine:
             exponents = self.combine(exponents)
         self.exponents = exponents
+        self._exp_cache = None
+
+    def _exponent_arrays(self):
+        # Contiguous arrays of the exponent coefficients and frequencies
+        # (structure-of-arrays layout), so that the correlation function and
+        # power spectrum can be evaluated without iterating the exponent
+        # objects. Rebuilt whenever the exponent list changes.
+        exponents = tuple(self.exponents)
+        if self._exp_cache is None or self._exp_cache[0] != exponents:
+            self._exp_cache = (
+                exponents,
+                np.array([exp.coefficient for exp in exponents]),
+                np.array([exp.exponent for exp in exponents]),
+            )
+        return self._exp_cache[1], self._exp_cache[2]
 
     @classmethod
     def combine(
@@ -1798,11 +1882,11 @@ class ExponentialBosonicEnvironment(BosonicEnvironment):
         """
 
         t = np.asarray(t, dtype=float)
-        corr = np.zeros_like(t, dtype=complex)
+        coefficients, exponents = self._exponent_arrays()
 
-        for exp in self.exponents:
-            corr += exp.coefficient * np.exp(-exp.exponent * np.abs(t))
-        corr[t < 0] = np.conj(corr[t < 0])
+        corr = _exp_sum(coefficients, exponents, np.abs(np.atleast_1d(t)))
+        negative = (np.atleast_1d(t) < 0)
+        corr[negative] = np.conj(corr[negative])
 
         return corr.item() if t.ndim == 0 else corr
 
@@ -1820,12 +1904,12 @@ class ExponentialBosonicEnvironment(BosonicEnvironment):
         """
 
         w = np.asarray(w, dtype=float)
-        S = np.zeros_like(w)
+        coefficients, exponents = self._exponent_arrays()
 
-        for exp in self.exponents:
-            S += 2 * np.real(
-                exp.coefficient / (exp.exponent - 1j * w)
-            )
+        S = np.sum(2 * np.real(
+            coefficients[:, None]
+            / (exponents[:, None] - 1j * np.atleast_1d(w)[None, :])
+        ), axis=0)
 
         return S.item() if w.ndim == 0 else S
 
@@ -1871,6 +1955,54 @@ def system_terminator(Q: Qobj, delta: float) -> Qobj:
 
 # --- utility functions ---
 
+def _coth(z):
+    r"""
+    Hyperbolic cotangent of a complex argument, evaluated via
+
+    .. math::
+        \coth(x + iy) = \frac{\sinh(2x) - i \sin(2y)}
+                             {2 (\sinh^2 x + \sin^2 y)} ,
+
+    which avoids the cancellation that the naive quotient suffers for small
+    arguments. For large real parts, where the hyperbolic functions would
+    overflow, the limit value of plus/minus 1 is used instead.
+    """
+    z = np.asarray(z, dtype=complex)
+    x = z.real
+    y = z.imag
+
+    large = (np.abs(x) > 350)
+    x_safe = np.where(large, 1.0, x)
+    result = ((np.sinh(2 * x_safe) - 1j * np.sin(2 * y))
+              / (2 * (np.sinh(x_safe)**2 + np.sin(y)**2)))
+    result = np.where(large, np.sign(x) + 0j, result)
+    return result.item() if z.ndim == 0 else result
+
+
+def _exp_sum(ck, vk, t):
+    r"""
+    Evaluates the multi-exponential sum
+    :math:`\sum_k c_k \exp(-\nu_k t)` on the given times.
+
+    The sum is accumulated in blocks of exponents so that the intermediate
+    arrays stay small (roughly L2-cache sized) instead of materializing the
+    full ``(len(ck), len(t))`` matrix, which dominates the memory traffic for
+    large numbers of exponents.
+    """
+    ck = np.asarray(ck)
+    vk = np.asarray(vk)
+    t = np.asarray(t)
+
+    result = np.zeros(t.shape, dtype=complex)
+    block = max(1, 32768 // max(1, t.size))
+    for start in range(0, len(ck), block):
+        sl = slice(start, start + block)
+        result += np.sum(
+            ck[sl, None] * np.exp(-vk[sl, None] * t[None, :]), axis=0
+        )
+    return result
+
+
 def _real_interpolation(fun, xlist, name, args=None):
     args = args or {}
     if callable(fun):
@@ -1887,9 +2019,12 @@ def _complex_interpolation(fun, xlist, name, args=None):
     if callable(fun):
         return lambda t: fun(t, **args)
     else:
-        real_interp = _real_interpolation(np.real(fun), xlist, name)
-        imag_interp = _real_interpolation(np.imag(fun), xlist, name)
-        return lambda x: real_interp(x) + 1j * imag_interp(x)
+        if xlist is None or len(xlist) != len(fun):
+            raise ValueError("A list of x-values with the same length must be "
+                             f"provided for the discretized function ({name})")
+        # CubicSpline supports complex values natively; a single spline is
+        # faster than interpolating real and imaginary parts separately
+        return CubicSpline(xlist, np.asarray(fun, dtype=complex))
 
 
 def _fft(f, wMax, tMax):
@@ -1929,29 +2064,85 @@ def _fft(f, wMax, tMax):
     t, dt = np.linspace(-tMax, tMax, numSamples, retstep=True)
     f_values = f(t)
 
-    # Compute Fourier transform by numpy's FFT function
-    g = np.fft.fft(f_values)
+    # Compute Fourier transform with scipy's (threaded) FFT functions. For
+    # real-valued f (e.g. a power spectrum), the transform is Hermitian and
+    # we only compute the non-negative frequency half with rfft.
+    if np.iscomplexobj(f_values):
+        g = scipy.fft.fft(f_values, workers=-1)
+    else:
+        g_half = scipy.fft.rfft(f_values, workers=-1)
+        if numSamples % 2 == 0:
+            g = np.concatenate([g_half, np.conj(g_half[-2:0:-1])])
+        else:
+            g = np.concatenate([g_half, np.conj(g_half[-1:0:-1])])
     # frequency normalization factor is 2 * np.pi / dt
-    w = np.fft.fftfreq(numSamples) * 2 * np.pi / dt
+    w = scipy.fft.fftfreq(numSamples) * 2 * np.pi / dt
     # In order to get a discretisation of the continuous Fourier transform
     # we need to multiply g by a phase factor
     g *= dt * np.exp(1j * w * tMax)
 
     return _complex_interpolation(
-        np.fft.fftshift(g), np.fft.fftshift(w), 'FFT'
+        scipy.fft.fftshift(g), scipy.fft.fftshift(w), 'FFT'
     )
 
 
 def _cf_real_fit_model(tlist, a, b, c, d=0):
-    return np.real((a + 1j * d) * np.exp((b + 1j * c) * np.abs(tlist)))
+    # Re[(a + id) exp((b + ic) |t|)], written out in real arithmetic to
+    # avoid the complex exponential and intermediate complex temporaries.
+    # In the simplified ansatz (d = 0), the sine term vanishes entirely.
+    abs_t = np.abs(tlist)
+    if np.all(d == 0):
+        return a * np.exp(b * abs_t) * np.cos(c * abs_t)
+    phase = c * abs_t
+    return np.exp(b * abs_t) * (a * np.cos(phase) - d * np.sin(phase))
 
 
 def _cf_imag_fit_model(tlist, a, b, c, d=0):
-    return np.sign(tlist) * np.imag(
-        (a + 1j * d) * np.exp((b + 1j * c) * np.abs(tlist))
+    # sign(t) Im[(a + id) exp((b + ic) |t|)], see _cf_real_fit_model
+    abs_t = np.abs(tlist)
+    if np.all(d == 0):
+        return np.sign(tlist) * (a * np.exp(b * abs_t) * np.sin(c * abs_t))
+    phase = c * abs_t
+    return np.sign(tlist) * (
+        np.exp(b * abs_t) * (a * np.sin(phase) + d * np.cos(phase))
     )
 
 
+def _cf_fit_coefficients(params, imag=False):
+    # Converts the fitted parameters (array of shape Nx3 or Nx4) of one part
+    # of the correlation function into the corresponding exponent
+    # coefficients and frequencies, as conjugate pairs in interleaved order.
+    params = np.asarray(params, dtype=float)
+    a, b, c = params[:, 0], params[:, 1], params[:, 2]
+    d = params[:, 3] if params.shape[1] == 4 else 0
+
+    amplitudes = (a + 1j * d) / 2
+    if imag:
+        amplitudes = -1j * amplitudes
+    ck = np.stack([amplitudes, np.conj(amplitudes)], axis=1).ravel()
+    vk = np.stack([-b - 1j * c, -b + 1j * c], axis=1).ravel()
+    return ck, vk
+
+
+def _cf_imag_fit_model_jac(tlist, a, b, c, d=None):
+    # Jacobian of _cf_imag_fit_model w.r.t. (a, b, c[, d])
+    abs_t = np.abs(tlist)
+    sign_t = np.sign(tlist)
+    decay = np.exp(b * abs_t)
+    cos_t = np.cos(c * abs_t)
+    sin_t = np.sin(c * abs_t)
+    d_val = 0 if d is None else d
+
+    columns = [
+        sign_t * decay * sin_t,
+        sign_t * abs_t * decay * (a * sin_t + d_val * cos_t),
+        sign_t * abs_t * decay * (a * cos_t - d_val * sin_t),
+    ]
+    if d is not None:
+        columns.append(sign_t * decay * cos_t)
+    return np.stack(columns, axis=1)
+
+
 def _default_guess_cfreal(tlist, clist, full_ansatz):
     corr_abs = np.abs(clist)
     corr_max = np.max(corr_abs)
@@ -1996,9 +2187,24 @@ def _default_guess_cfimag(clist, full_ansatz):
 
 
 def _sd_fit_model(wlist, a, b, c):
-    return (
-        2 * a * b * wlist / ((wlist + c)**2 + b**2) / ((wlist - c)**2 + b**2)
-    )
+    # ((w+c)^2 + b^2) ((w-c)^2 + b^2) = (w^2 + b^2 + c^2)^2 - (2wc)^2,
+    # which avoids expanding the two binomials separately
+    s = wlist * wlist + (b * b + c * c)
+    x = 2 * c * wlist
+    return 2 * a * b * wlist / (s * s - x * x)
+
+
+def _sd_fit_model_jac(wlist, a, b, c):
+    # Jacobian of _sd_fit_model w.r.t. (a, b, c)
+    d1 = (wlist + c)**2 + b**2
+    d2 = (wlist - c)**2 + b**2
+    denom = d1 * d2
+
+    return np.stack([
+        2 * b * wlist / denom,
+        2 * a * wlist * (denom - 2 * b**2 * (d1 + d2)) / denom**2,
+        -4 * a * b * wlist * ((wlist + c) * d2 - (wlist - c) * d1) / denom**2,
+    ], axis=1)
 
 
 def _default_guess_sd(wlist, jlist):
@@ -790,6 +790,40 @@ class TestUDEnvironment:
 
         assert_equivalent(approx_combine, approx, tol=1e-8)
 
+    @pytest.mark.parametrize("params", [
+        {'gamma': 2.5, 'lam': .75, 'w0': 5, 'T': 1.5},
+    ])
+    def test_parameter_mutation(self, params):
+        # The correlation function is computed via FFT and the result is
+        # cached; mutating a parameter must invalidate the cache
+        env = UnderDampedEnvironment(**params)
+        tlist = np.linspace(0, 5, 100)
+        env.correlation_function(tlist)
+
+        env.lam = 2 * params['lam']
+        reference = UnderDampedEnvironment(
+            **{**params, 'lam': 2 * params['lam']})
+        assert_allclose(env.correlation_function(tlist),
+                        reference.correlation_function(tlist),
+                        tol=1e-8)
+
+    @pytest.mark.parametrize("params", [
+        {'gamma': .1, 'lam': .3, 'w0': 1, 'T': .5},
+    ])
+    def test_cf_fit_quality(self, params):
+        # Regression test: the correlation function fit must get close to the
+        # requested rmse (it may stop further away if Nr_max / Ni_max is
+        # reached, but not by orders of magnitude)
+        env = UnderDampedEnvironment(**params)
+        tlist = np.linspace(0, 60, 300)[1:]
+        fit, info = env.approx_by_cf_fit(
+            tlist, target_rsme=2e-5, Nr_max=4, Ni_max=4
+        )
+
+        assert isinstance(fit, ExponentialBosonicEnvironment)
+        assert info["rmse_real"] < 1e-3
+        assert info["rmse_imag"] < 1e-3
+
 
 @pytest.mark.parametrize("params", [
     pytest.param({'alpha': .75, 'wc': 10, 's': 1, 'T': 3},
@@ -142,4 +142,31 @@ class TestFitting:
         assert rmse < 1e-8
         print(params)
         assert (np.all(np.isclose(params, [fparams1, fparams2], atol=1e-3)) or
-                np.all(np.isclose(params, [fparams2, fparams1], atol=1e-3)))
\ No newline at end of file
+                np.all(np.isclose(params, [fparams2, fparams1], atol=1e-3)))
+
+    def model_jac(self, x, a, b, c):
+        decay = np.exp(-b * x)
+        return np.stack([
+            decay * np.cos(c * x),
+            -a * x * decay * np.cos(c * x),
+            -a * x * decay * np.sin(c * x),
+        ], axis=1)
+
+    def test_analytic_jacobian(self):
+        x = np.linspace(0, 10, 100)
+
+        fparams1 = [1, .5, 0]
+        fparams2 = [3, 2, .5]
+        y = self.model(x, *fparams1) + self.model(x, *fparams2)
+
+        rmse, params = utils.iterated_fit(
+            self.model, num_params=3, xdata=x, ydata=y,
+            lower=[-np.inf, -np.inf, 0], target_rmse=1e-8, Nmax=2,
+            jac=self.model_jac)
+        # the same fit with the Jacobian estimated by finite differences
+        rmse_fd, params_fd = utils.iterated_fit(
+            self.model, num_params=3, xdata=x, ydata=y,
+            lower=[-np.inf, -np.inf, 0], target_rmse=1e-8, Nmax=2)
+
+        assert rmse < 1e-8
+        assert np.all(np.isclose(params, params_fd, atol=1e-3))
\ No newline at end of file
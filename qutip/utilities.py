@@ -43,14 +43,16 @@ def n_thermal(w, w_th):
     """
 
     w = np.array(w, dtype=float)
-    result = np.zeros_like(w)
 
     if w_th <= 0:
-        result[w < 0] = -1
+        result = np.where(w < 0, -1.0, 0.0)
         return result.item() if w.ndim == 0 else result
 
-    non_zero = w != 0
-    result[non_zero] = 1 / (np.exp(w[non_zero] / w_th) - 1)
+    # branchless evaluation: replace zeros by a harmless dummy frequency and
+    # substitute the limit value afterwards; expm1 is more accurate than
+    # exp(x) - 1 for small arguments
+    w_safe = np.where(w == 0, 1.0, w)
+    result = np.where(w == 0, 0.0, 1 / np.expm1(w_safe / w_th))
 
     return result.item() if w.ndim == 0 else result
 
@@ -360,7 +362,8 @@ def iterated_fit(
     lower: ArrayLike = None,
     upper: ArrayLike = None,
     sigma: float | ArrayLike = None,
-    maxfev: int = None
+    maxfev: int = None,
+    jac: Callable[..., ArrayLike] = None
 ) -> tuple[float, ArrayLike]:
     r"""
     Iteratively tries to fit the given data with a model of the form
@@ -408,6 +411,11 @@ def iterated_fit(
         ``scipy.optimize.curve_fit``.
     maxfev : optional, int
         The maximum number of function evaluations (per value of ``N``).
+    jac : optional, callable
+        The Jacobian of the model function `fun` with respect to its
+        parameters. Takes the same arguments as `fun` and returns an array of
+        shape `(len(xdata), num_params)`. If not provided, the Jacobian is
+        estimated by finite differences.
 
     Returns
     -------
@@ -432,6 +440,7 @@ def iterated_fit(
 
     N = Nmin
     rmse1 = np.inf
+    params = None
 
     while rmse1 > target_rmse and N <= Nmax:
         if guess is None:
@@ -444,11 +453,16 @@ def iterated_fit(
         else:
             guesses = np.tile(guess, (N, 1))
 
+        if params is not None:
+            # Warm start: seed this iteration with the solution found for the
+            # previous N, so only the newly added term starts from scratch
+            guesses[:len(params)] = params
+
         lower_repeat = np.tile(lower, N)
         upper_repeat = np.tile(upper, N)
         rmse1, params = _fit(fun, num_params, xdata, ydata,
                              guesses, lower_repeat,
-                             upper_repeat, sigma, maxfev)
+                             upper_repeat, sigma, maxfev, jac=jac)
         N += 1
 
     return rmse1, params
@@ -468,6 +482,18 @@ def _unpack(params, num_params):
 
 
 def _evaluate(fun, x, params):
+    # Fast path: evaluate all terms at once by passing the parameters as
+    # column vectors, so that a model function built from NumPy broadcasts
+    # returns a (N, len(x)) array that we reduce in compiled code. Model
+    # functions that do not broadcast are evaluated term by term instead.
+    params = np.asarray(params)
+    try:
+        terms = fun(x, *(column[:, np.newaxis] for column in params.T))
+        if np.shape(terms) == (len(params),) + np.shape(x):
+            return np.sum(terms, axis=0)
+    except Exception:
+        pass
+
     result = 0
     for term_params in params:
         result += fun(x, *term_params)
@@ -489,7 +515,7 @@ def _rmse(fun, xdata, ydata, params):
 
 
 def _fit(fun, num_params, xdata, ydata, guesses, lower, upper, sigma,
-         maxfev, method='trf'):
+         maxfev, method='trf', jac=None):
     # fun: model function
     # num_params: number of parameters in fun
     # xdata, ydata: data to be fit
@@ -499,26 +525,39 @@ def _fit(fun, num_params, xdata, ydata, guesses, lower, upper, sigma,
     # sigma: data uncertainty (useful to control when values are small)
     # maxfev: how many times the parameters can be altered, lower is faster but
     #         less accurate
+    # jac: analytical Jacobian of fun, returns (len(xdata), num_params)
     if (upper <= lower).all():
         return _rmse(fun, xdata, ydata, guesses), guesses
 
     # Depending on the method, scipy uses leastsq or least_squares, and the
     # `maxfev` parameter has different names in the two functions
     if method == 'lm':
-        maxfev_arg = {'maxfev': maxfev}
+        extra_args = {'maxfev': maxfev}
     else:
-        maxfev_arg = {'max_nfev': maxfev}
+        extra_args = {'max_nfev': maxfev}
 
     # Scipy only supports scalar sigma since 1.12
     if sigma is not None and not hasattr(sigma, "__len__"):
         sigma = [sigma] * len(xdata)
 
+    if jac is None:
+        packed_jac = None
+    else:
+        # The Jacobian of the full model is the per-term Jacobians side by
+        # side, in the same order in which _pack lays out the parameters
+        def packed_jac(x, *packed_params):
+            return np.hstack([
+                jac(x, *term_params)
+                for term_params in _unpack(np.asarray(packed_params),
+                                           num_params)
+            ])
+
     packed_params, _ = curve_fit(
         lambda x, *packed_params: _evaluate(
             fun, x, _unpack(packed_params, num_params)
         ),
         xdata, ydata, p0=_pack(guesses), bounds=(lower, upper),
-        method=method, sigma=sigma, **maxfev_arg
+        method=method, sigma=sigma, jac=packed_jac, **extra_args
     )
     params = _unpack(packed_params, num_params)
     rmse = _rmse(fun, xdata, ydata, params)